@@ -1,5 +1,5 @@
-from gridfinity.baseplate import baseplate
-from gridfinity.bin import base, bin, lip
+import importlib
+
 from gridfinity.config import GridfinityConfig
 
 __all__ = [
@@ -8,4 +8,26 @@ __all__ = [
     "base",
     "lip",
     "baseplate",
+    "export_stl",
 ]
+
+# Geometry modules pull in cadquery's OCP/OpenCascade bindings, which take
+# over a second to import. Resolve them lazily so layout-only consumers
+# (e.g. tools.drawer's planning functions) only pay for the config module.
+# The modules are named _bin/_baseplate so the public functions bound here
+# never collide with their home modules as package attributes
+_LAZY_ATTRS = {
+    "baseplate": "gridfinity._baseplate",
+    "bin": "gridfinity._bin",
+    "base": "gridfinity._bin",
+    "lip": "gridfinity._bin",
+    "export_stl": "gridfinity.export",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,194 @@
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import cadquery as cq
+import numpy as np
+
+from gridfinity._numeric import face_mask, grid_offsets
+from gridfinity.config import GridfinityConfig
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CONFIG = GridfinityConfig()
+
+
+def baseplate(
+    x: int = 2,
+    y: int = 2,
+    thickness: float = 5.0,
+    num_divisions: int = 1,
+    config: Optional[GridfinityConfig] = None,
+) -> cq.Workplane:
+    """Creates a Gridfinity-compatible baseplate.
+
+    The baseplate follows the profile of the bin base for each grid position,
+    allowing bins to snap securely into place.
+
+    Args:
+        x: Number of units in X direction
+        y: Number of units in Y direction
+        thickness: Thickness of the baseplate in mm (default: 5.0)
+        num_divisions: Number of spatial tiles per axis used to subdivide the
+            base pattern cut; booleans are super-linear in tool complexity, so
+            several smaller cuts can beat one large cut on big grids
+        config: Custom configuration (uses defaults if None)
+
+    Returns:
+        CadQuery Workplane containing the baseplate geometry
+    """
+    if x < 1 or y < 1:
+        raise ValueError(f"Dimensions must be positive: x={x}, y={y}")
+    if thickness <= 0:
+        raise ValueError(f"Thickness must be positive: {thickness}")
+    if num_divisions < 1:
+        raise ValueError(f"num_divisions must be positive: {num_divisions}")
+
+    cfg = config or _DEFAULT_CONFIG
+    logger.info("Creating Gridfinity baseplate: %sx%s units, %smm thick", x, y, thickness)
+
+    # Calculate overall baseplate dimensions - exactly 42mm x 42mm per unit (no tolerance)
+    plate_width = x * cfg.unit_size
+    plate_depth = y * cfg.unit_size
+
+    # Create the base plate with 8mm corner radius
+    result = cq.Workplane("XY").box(plate_width, plate_depth, thickness)
+    result = result.edges("|Z").fillet(cfg.outer_fillet)
+
+    # Cut the base pattern into the top of the baseplate, tile by tile
+    for tool in _create_baseplate_tools(x, y, thickness, num_divisions, cfg):
+        result = result.cut(tool)
+
+    # Select the bottom faces of the cuts and extrude downward to remove excess material
+    # This hollows out the baseplate from below
+    cut_bottom_z = thickness / 2 - cfg.base_height
+
+    # Cheap bounding-box prefilter: only faces whose bbox midpoint lies near
+    # the cut bottom pay for the surface-integral Center() confirmation
+    candidates = []
+    for face in result.faces().vals():
+        bb = face.BoundingBox()
+        if abs((bb.zmin + bb.zmax) / 2 - cut_bottom_z) < 0.1:
+            candidates.append(face)
+
+    centers_z = np.array([face.Center().z for face in candidates])
+    mask = face_mask(centers_z, cut_bottom_z, 0.1)
+    bottom_faces_list = [face for face, hit in zip(candidates, mask) if hit]
+
+    # Build one cutting tool covering every cut bottom, then subtract it in a
+    # single boolean instead of running cutThruAll once per face. The faces
+    # are already in hand, so use their outer wires directly rather than
+    # re-selecting each one on the accumulating solid.
+    cutters = [
+        cq.Solid.extrudeLinear(
+            cq.Face.makeFromWires(face.outerWire()), cq.Vector(0, 0, -thickness)
+        )
+        for face in bottom_faces_list
+    ]
+    if cutters:
+        result = result.cut(cq.Compound.makeCompound(cutters))
+
+    logger.info("Baseplate created successfully")
+    return result
+
+
+def _rounded_rect_wire(size: float, radius: float, z: float) -> cq.Wire:
+    """Creates a rounded-square wire of the given size and corner radius."""
+    return (
+        cq.Workplane("XY", origin=(0, 0, z))
+        .rect(size - 2 * radius, size - 2 * radius)
+        .offset2D(radius, kind="arc")
+        .val()
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _create_baseplate_unit(thickness: float, config: GridfinityConfig) -> cq.Solid:
+    """Creates a single Gridfinity baseplate unit solid, cached per config.
+
+    This creates the inverse of the bin base - a raised area that the bin base
+    will fit into. The unit is lofted through the inward-offset profile
+    sections rather than sweeping a cutter around a filleted box.
+    """
+    unit_size = config.inner_unit
+    sections = [
+        _rounded_rect_wire(
+            unit_size + 2 * x, config.outer_fillet + x, z - config.base_height / 2
+        )
+        for x, z in config.base_coords
+    ]
+    return cq.Solid.makeLoft(sections, True)
+
+
+def _grid_locations(
+    x: int, y: int, unit_size: float, z_offset: float = 0.0
+) -> list[cq.Location]:
+    """Computes cell Locations for an x-by-y grid centered on the origin."""
+    return [
+        cq.Location(cq.Vector(ox, oy, z_offset))
+        for ox, oy in grid_offsets(x, y, unit_size)
+    ]
+
+
+def _batch_union(solids: list[cq.Shape]) -> cq.Shape:
+    """Fuses solids pairwise in a balanced tree instead of a linear fold.
+
+    A left-fold of N fuses re-processes the growing result every step;
+    folding in rounds keeps both operands of each fuse similar in size.
+    """
+    solids = list(solids)
+    while len(solids) > 1:
+        fused = [a.fuse(b) for a, b in zip(solids[0::2], solids[1::2])]
+        if len(solids) % 2:
+            fused.append(solids[-1])
+        solids = fused
+    return solids[0]
+
+
+def _moved_copies(solid: cq.Solid, locations: list[cq.Location]) -> list[cq.Shape]:
+    """Copies a solid to each location, in parallel for multi-cell grids.
+
+    OCCT releases the GIL during the transform, so threads scale here.
+    """
+    if len(locations) <= 1:
+        return [solid.moved(loc) for loc in locations]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(solid.moved, locations))
+
+
+def _create_baseplate_tools(
+    x: int, y: int, thickness: float, num_divisions: int, config: GridfinityConfig
+) -> list[cq.Shape]:
+    """Creates the pattern of baseplate units as one or more cut tools.
+
+    Base units are positioned at each grid location, then grouped into
+    num_divisions x num_divisions spatial tiles; each tile is fused into a
+    single solid so the caller runs one boolean per tile.
+    """
+    base_solid = _create_baseplate_unit(thickness, config)
+
+    # Position the pattern to cut into the baseplate from the top
+    # Top of base units flush with top of baseplate, extending downward into it
+    base_z_offset = thickness / 2 - config.base_height / 2
+
+    # A 1x1 grid is just the base unit itself; skip the grid machinery
+    if x == 1 and y == 1:
+        return [base_solid.moved(cq.Location(cq.Vector(0, 0, base_z_offset)))]
+
+    locations = _grid_locations(x, y, config.unit_size, base_z_offset)
+    cells = _moved_copies(base_solid, locations)
+
+    if num_divisions <= 1:
+        return [_batch_union(cells)]
+
+    # _grid_locations emits cells row-major (all x for each y), so cell
+    # index j * x + i maps back to grid coordinates (i, j)
+    tiles: dict[tuple[int, int], list[cq.Shape]] = {}
+    for index, cell in enumerate(cells):
+        i, j = index % x, index // x
+        key = (i * num_divisions // x, j * num_divisions // y)
+        tiles.setdefault(key, []).append(cell)
+
+    return [_batch_union(group) for group in tiles.values()]
@@ -0,0 +1,158 @@
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import cadquery as cq
+
+from gridfinity._numeric import grid_offsets
+from gridfinity.config import GridfinityConfig
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CONFIG = GridfinityConfig()
+
+
+def bin(
+    x: int = 2,
+    y: int = 2,
+    z: int = 5,
+    lip: bool = True,
+    config: Optional[GridfinityConfig] = None,
+) -> cq.Workplane:
+    """Creates a Gridfinity-compatible storage bin.
+
+    Args:
+        x: Number of units in X direction
+        y: Number of units in Y direction
+        z: Height in units
+        lip: Whether to include top lip
+        config: Custom configuration (uses defaults if None)
+
+    Returns:
+        CadQuery Workplane containing the bin geometry
+    """
+    if x < 1 or y < 1 or z < 1:
+        raise ValueError(f"Dimensions must be positive: x={x}, y={y}, z={z}")
+
+    cfg = config or _DEFAULT_CONFIG
+    logger.info("Creating Gridfinity bin: %sx%sx%s units", x, y, z)
+
+    bin_width = x * cfg.unit_size - 2 * cfg.tolerance
+    bin_depth = y * cfg.unit_size - 2 * cfg.tolerance
+    bin_height = z * cfg.height_unit - cfg.base_height
+
+    body = cq.Workplane("XY").box(bin_width, bin_depth, bin_height)
+    body = body.edges("+Z").fillet(cfg.inner_fillet)
+
+    parts = [body.val()]
+    if lip:
+        parts.append(_create_lip(body, cfg))
+    parts.append(_create_base_pattern(x, y, z, cfg))
+
+    result = cq.Workplane(obj=cq.Compound.makeCompound(parts))
+
+    logger.info("Bin created successfully")
+    return result
+
+
+def _rounded_rect_wire(size: float, radius: float, z: float) -> cq.Wire:
+    """Creates a rounded-square wire of the given size and corner radius."""
+    return (
+        cq.Workplane("XY", origin=(0, 0, z))
+        .rect(size - 2 * radius, size - 2 * radius)
+        .offset2D(radius, kind="arc")
+        .val()
+    )
+
+
+def _offset_wire(wire: cq.Wire, offset: float, z_shift: float) -> cq.Wire:
+    """Offsets a planar wire in its plane and shifts it along Z."""
+    shift = cq.Location(cq.Vector(0, 0, z_shift))
+    if abs(offset) < 1e-9:
+        return wire.moved(shift)
+    return wire.offset2D(offset, kind="arc")[0].moved(shift)
+
+
+def _create_lip(bin: cq.Workplane, config: GridfinityConfig) -> cq.Solid:
+    """Creates lip geometry for a bin.
+
+    The lip ring is the outer wall extended upward minus a loft through the
+    inward-offset profile sections - one extrude and one loft instead of a
+    Frenet sweep around the top wire.
+    """
+    wire = bin.faces(">Z").wires(cq.selectors.LengthNthSelector(-1)).val()
+    coords = config.lip_coords
+    lip_height = coords[-1][1]
+
+    outer = cq.Solid.extrudeLinear(
+        cq.Face.makeFromWires(wire), cq.Vector(0, 0, lip_height)
+    )
+    inner = cq.Solid.makeLoft([_offset_wire(wire, x, z) for x, z in coords], True)
+    return outer.cut(inner)
+
+
+@functools.lru_cache(maxsize=16)
+def _create_base_unit(config: GridfinityConfig) -> cq.Solid:
+    """Creates a single Gridfinity base unit solid, cached per config.
+
+    The unit is lofted through the inward-offset profile sections rather
+    than sweeping a cutter around the bottom wire of a filleted box.
+    """
+    unit_size = config.inner_unit
+    fillet = config.inner_fillet
+    sections = [
+        _rounded_rect_wire(unit_size + 2 * x, fillet + x, z - config.base_height / 2)
+        for x, z in config.base_coords
+    ]
+    return cq.Solid.makeLoft(sections, True)
+
+
+def _grid_locations(
+    x: int, y: int, unit_size: float, z_offset: float = 0.0
+) -> list[cq.Location]:
+    """Computes cell Locations for an x-by-y grid centered on the origin."""
+    return [
+        cq.Location(cq.Vector(ox, oy, z_offset))
+        for ox, oy in grid_offsets(x, y, unit_size)
+    ]
+
+
+def _moved_copies(solid: cq.Solid, locations: list[cq.Location]) -> list[cq.Shape]:
+    """Copies a solid to each location, in parallel for multi-cell grids.
+
+    OCCT releases the GIL during the transform, so threads scale here.
+    """
+    if len(locations) <= 1:
+        return [solid.moved(loc) for loc in locations]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(solid.moved, locations))
+
+
+def _create_base_pattern(
+    x: int, y: int, z: int, config: GridfinityConfig
+) -> cq.Shape:
+    """Creates a pattern of base units as a single compound."""
+    base_solid = _create_base_unit(config)
+
+    base_z_offset = (
+        -(z * config.height_unit - config.base_height) / 2 - config.base_height / 2
+    )
+
+    # A 1x1 grid is just the base unit itself; skip the grid machinery
+    if x == 1 and y == 1:
+        return base_solid.moved(cq.Location(cq.Vector(0, 0, base_z_offset)))
+
+    locations = _grid_locations(x, y, config.unit_size, base_z_offset)
+    return cq.Compound.makeCompound(_moved_copies(base_solid, locations))
+
+
+def lip(bin: cq.Workplane) -> cq.Workplane:
+    """Adds a lip to an existing Gridfinity-compatible storage bin."""
+    return cq.Workplane(obj=_create_lip(bin, _DEFAULT_CONFIG))
+
+
+def base() -> cq.Workplane:
+    """Returns a single base unit for a Gridfinity-compatible storage bin."""
+    return cq.Workplane(obj=_create_base_unit(_DEFAULT_CONFIG))
@@ -0,0 +1,50 @@
+"""Numeric kernels for grid layout, JIT-compiled when numba is available.
+
+numba is an optional dependency; without it the helpers run as plain
+numpy, which is already fast enough for small grids.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True)
+def grid_offsets(x: int, y: int, unit_size: float) -> np.ndarray:
+    """Returns the (x*y, 2) array of cell center offsets, row-major in y."""
+    out = np.empty((x * y, 2))
+    for j in range(y):
+        for i in range(x):
+            out[j * x + i, 0] = (i - (x - 1) / 2) * unit_size
+            out[j * x + i, 1] = (j - (y - 1) / 2) * unit_size
+    return out
+
+
+@njit(cache=True)
+def face_mask(centers_z: np.ndarray, target_z: float, tol: float) -> np.ndarray:
+    """Boolean mask of values within tol of target_z."""
+    return np.abs(centers_z - target_z) < tol
+
+
+@njit(cache=True)
+def spacer_piece_count(
+    gap: float, length: float, max_length: float, max_aspect_ratio: float
+) -> int:
+    """Number of spacer pieces needed to satisfy the length and aspect limits.
+
+    The epsilon keeps FP noise at exact multiples from rounding up.
+    """
+    eps = 1e-9
+    by_length = int(np.ceil(length / max_length - eps))
+    by_ratio = int(np.ceil(length / (gap * max_aspect_ratio) - eps))
+    return max(by_length, by_ratio)
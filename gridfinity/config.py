@@ -1,7 +1,17 @@
+import functools
 from dataclasses import dataclass
+from itertools import accumulate
 
 
-@dataclass(frozen=True)
+@functools.lru_cache(maxsize=8)
+def _accumulate_steps(
+    steps: tuple[tuple[float, float], ...],
+) -> tuple[tuple[float, float], ...]:
+    """Accumulates relative profile steps into absolute (offset, height) pairs."""
+    return tuple(accumulate(steps, lambda a, b: (a[0] + b[0], a[1] + b[1])))
+
+
+@dataclass(frozen=True, slots=True)
 class GridfinityConfig:
     """Gridfinity specification constants."""
 
@@ -22,3 +32,23 @@ class GridfinityConfig:
         (0, 1.8),
         (2.15, 2.15),
     )
+
+    @property
+    def lip_coords(self) -> tuple[tuple[float, float], ...]:
+        """Absolute (offset, height) coordinates of the lip profile."""
+        return _accumulate_steps(self.lip_steps)
+
+    @property
+    def base_coords(self) -> tuple[tuple[float, float], ...]:
+        """Absolute (offset, height) coordinates of the base profile."""
+        return _accumulate_steps(self.base_steps)
+
+    @property
+    def inner_unit(self) -> float:
+        """Unit footprint less the bin tolerance on both sides."""
+        return self.unit_size - 2 * self.tolerance
+
+    @property
+    def inner_fillet(self) -> float:
+        """Outer corner fillet reduced by the bin tolerance."""
+        return self.outer_fillet - self.tolerance
@@ -0,0 +1,48 @@
+import logging
+from pathlib import Path
+from typing import Union
+
+import cadquery as cq
+from OCP.BRepMesh import BRepMesh_IncrementalMesh
+from OCP.StlAPI import StlAPI_Writer
+
+logger = logging.getLogger(__name__)
+
+
+def export_stl(
+    shape: cq.Workplane,
+    path: Union[str, Path],
+    linear_deflection: float = 0.1,
+    angular_deflection: float = 0.5,
+) -> None:
+    """Exports a shape to a binary STL file.
+
+    The whole shape is tessellated in a single BRepMesh pass with the
+    parallel flag set, so the mesher is shared across all sub-solids and
+    per-face triangulation is spread over the available cores. The file is
+    written next to the destination and published with one rename, so a
+    failed export never leaves a truncated STL behind.
+
+    Args:
+        shape: Workplane containing the geometry to export
+        path: Destination STL file path
+        linear_deflection: Maximum mesh-to-surface deviation in mm
+        angular_deflection: Maximum angle between adjacent normals in radians
+    """
+    compound = shape.val()
+    BRepMesh_IncrementalMesh(
+        compound.wrapped, linear_deflection, False, angular_deflection, True
+    )
+    target = Path(path)
+    tmp = target.with_name(f"{target.name}.partial")
+    _write_stl(compound, tmp)
+    tmp.replace(target)
+    logger.info("Exported STL: %s", path)
+
+
+def _write_stl(shape: cq.Shape, path: Union[str, Path]) -> None:
+    """Writes an already-tessellated shape to a binary STL file."""
+    writer = StlAPI_Writer()
+    writer.ASCIIMode = False
+    if not writer.Write(shape.wrapped, str(path)):
+        raise IOError(f"Failed to write STL file: {path}")
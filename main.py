@@ -1,7 +1,5 @@
-import cadquery as cq
-
-from gridfinity import baseplate, bin
+from gridfinity import baseplate, bin, export_stl
 
 output = bin(1, 1, 1)
 # Export to STL file (for 3D printing)
-cq.exporters.export(output, "outputs/output.stl")
+export_stl(output, "outputs/output.stl")
@@ -1,7 +1,7 @@
 import cadquery as cq
 import pytest
 
-from gridfinity import baseplate
+from gridfinity import baseplate, export_stl
 
 
 def test_baseplate_creation():
@@ -46,7 +46,7 @@ def test_baseplate_export():
     output_path = "outputs/test_baseplate.stl"
 
     os.makedirs("outputs", exist_ok=True)
-    cq.exporters.export(plate, output_path)
+    export_stl(plate, output_path)
 
     assert os.path.exists(output_path)
     assert os.path.getsize(output_path) > 0
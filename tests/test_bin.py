@@ -1,7 +1,7 @@
 import cadquery as cq
 import pytest
 
-from gridfinity import bin
+from gridfinity import bin, export_stl
 
 
 def test_bin_creation():
@@ -64,7 +64,7 @@ def test_bin_export():
     output_path = "outputs/test_bin.stl"
 
     os.makedirs("outputs", exist_ok=True)
-    cq.exporters.export(storage_bin, output_path)
+    export_stl(storage_bin, output_path)
 
     assert os.path.exists(output_path)
     assert os.path.getsize(output_path) > 0
@@ -0,0 +1,41 @@
+from tools.drawer import _optimize_cached, calculate_spacer_dimensions
+
+
+def test_spacer_single_piece():
+    """Test that a short gap stays a single spacer."""
+    spacers = calculate_spacer_dimensions(30.0, 100.0)
+    assert spacers == [(30.0, 100.0)]
+
+
+def test_spacer_exact_max_length_multiple():
+    """Test that length equal to N * max_length yields exactly N pieces."""
+    spacers = calculate_spacer_dimensions(50.0, 300.0, max_length=150.0)
+    assert len(spacers) == 2
+    assert all(depth == 150.0 for _, depth in spacers)
+
+
+def test_spacer_exact_aspect_ratio_boundary():
+    """Test that length exactly at the aspect-ratio limit is not split."""
+    # gap * max_aspect_ratio == length, so one piece satisfies both limits
+    spacers = calculate_spacer_dimensions(20.0, 100.0, max_aspect_ratio=5.0)
+    assert spacers == [(20.0, 100.0)]
+
+
+def test_spacer_split_lengths_sum_to_total():
+    """Test that split spacer pieces cover the full length."""
+    spacers = calculate_spacer_dimensions(16.0, 400.0)
+    assert sum(depth for _, depth in spacers) == 400.0
+
+
+def test_layout_exact_bed_multiple():
+    """Test that a drawer spanning exact bed multiples splits evenly."""
+    plates = _optimize_cached(12, 12, 6, 6)
+    assert len(plates) == 4
+    assert all(plate == (6, 6) for plate in plates)
+
+
+def test_layout_covers_all_units():
+    """Test that the optimized layout covers the full drawer area."""
+    plates = _optimize_cached(11, 7, 6, 6)
+    assert sum(x * y for x, y in plates) == 11 * 7
+    assert all(x <= 6 and y <= 6 for x, y in plates)
@@ -1,17 +1,30 @@
 #!/usr/bin/env python3
 """Generate Gridfinity baseplates to fill a drawer with optimal printer bed usage."""
 
+from __future__ import annotations
+
 import argparse
+import functools
+import hashlib
 import logging
-import math
+import os
+import shutil
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import cadquery as cq
+import numpy as np
 
-from gridfinity import baseplate
 from gridfinity.config import GridfinityConfig
 
+if TYPE_CHECKING:
+    import cadquery as cq
+
+# cadquery (and gridfinity modules that pull it in) takes over a second to
+# import because of the OCP/OpenCascade bindings. Layout-only callers never
+# need it, so geometry functions import it on first use instead
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -22,11 +35,19 @@ PRINTER_BED_DEPTH = 256.0  # mm
 # Output directory
 OUTPUT_DIR = Path("outputs/drawer")
 
+# Default STL tessellation tolerances (mm / radians). Coarser than cadquery's
+# defaults: detail below the printer's resolution has no physical effect and
+# only inflates meshing time and file size
+STL_TOLERANCE = 0.1
+STL_ANGULAR_TOLERANCE = 0.3
+
 
 def calculate_baseplates(
     drawer_width: float,
     drawer_depth: float,
     config: Optional[GridfinityConfig] = None,
+    bed_width: float = PRINTER_BED_WIDTH,
+    bed_depth: float = PRINTER_BED_DEPTH,
 ) -> dict:
     """Calculate the optimal baseplate layout for a drawer.
 
@@ -39,6 +60,8 @@ def calculate_baseplates(
         drawer_width: Width of drawer in mm
         drawer_depth: Depth of drawer in mm
         config: GridfinityConfig instance (uses default if None)
+        bed_width: Printer bed width in mm
+        bed_depth: Printer bed depth in mm
 
     Returns:
         Dictionary containing:
@@ -52,31 +75,35 @@ def calculate_baseplates(
     units_x = int(drawer_width // cfg.unit_size)
     units_y = int(drawer_depth // cfg.unit_size)
 
-    logger.info(f"Drawer: {drawer_width}mm x {drawer_depth}mm")
-    logger.info(f"Total units that fit: {units_x} x {units_y}")
+    logger.info("Drawer: %smm x %smm", drawer_width, drawer_depth)
+    logger.info("Total units that fit: %s x %s", units_x, units_y)
 
     # Calculate remaining gaps
     gap_x = drawer_width - (units_x * cfg.unit_size)
     gap_y = drawer_depth - (units_y * cfg.unit_size)
 
-    logger.info(f"Remaining gaps: {gap_x:.2f}mm x {gap_y:.2f}mm")
+    logger.info("Remaining gaps: %.2fmm x %.2fmm", gap_x, gap_y)
 
     # Calculate how many units fit on the printer bed
-    max_units_x = int(PRINTER_BED_WIDTH // cfg.unit_size)
-    max_units_y = int(PRINTER_BED_DEPTH // cfg.unit_size)
+    max_units_x = int(bed_width // cfg.unit_size)
+    max_units_y = int(bed_depth // cfg.unit_size)
 
     logger.info(
-        f"Max units per print: {max_units_x} x {max_units_y} "
-        f"(bed: {PRINTER_BED_WIDTH}mm x {PRINTER_BED_DEPTH}mm)"
+        "Max units per print: %s x %s (bed: %smm x %smm)",
+        max_units_x,
+        max_units_y,
+        bed_width,
+        bed_depth,
     )
 
     # Generate optimal baseplate layout
     baseplates = _optimize_baseplate_layout(units_x, units_y, max_units_x, max_units_y, cfg)
 
-    logger.info(f"Generated {len(baseplates)} baseplates:")
+    logger.info("Generated %s baseplates:", len(baseplates))
     for i, (x, y) in enumerate(baseplates, 1):
         logger.info(
-            f"  Baseplate {i}: {x} x {y} units ({x * cfg.unit_size}mm x {y * cfg.unit_size}mm)"
+            "  Baseplate %s: %s x %s units (%smm x %smm)",
+            i, x, y, x * cfg.unit_size, y * cfg.unit_size,
         )
 
     return {
@@ -86,6 +113,49 @@ def calculate_baseplates(
     }
 
 
+def _min_plates(
+    width: int,
+    height: int,
+    max_x: int,
+    max_y: int,
+    memo: Optional[dict] = None,
+) -> tuple[int, list[tuple[int, int]]]:
+    """Finds a minimal guillotine partition of a width x height unit grid.
+
+    Every plate must fit the printer bed (max_x x max_y units). Each
+    recursion tries all vertical and horizontal cut positions and is
+    memoized on (width, height), so the table stays tiny for realistic
+    drawers.
+
+    Returns:
+        Tuple of (plate count, list of (x_units, y_units) plates)
+    """
+    if memo is None:
+        memo = {}
+    key = (width, height)
+    if key in memo:
+        return memo[key]
+
+    if width <= max_x and height <= max_y:
+        memo[key] = (1, [(width, height)])
+        return memo[key]
+
+    best: Optional[tuple[int, list[tuple[int, int]]]] = None
+    for cut in range(1, width // 2 + 1):
+        count_a, plates_a = _min_plates(cut, height, max_x, max_y, memo)
+        count_b, plates_b = _min_plates(width - cut, height, max_x, max_y, memo)
+        if best is None or count_a + count_b < best[0]:
+            best = (count_a + count_b, plates_a + plates_b)
+    for cut in range(1, height // 2 + 1):
+        count_a, plates_a = _min_plates(width, cut, max_x, max_y, memo)
+        count_b, plates_b = _min_plates(width, height - cut, max_x, max_y, memo)
+        if best is None or count_a + count_b < best[0]:
+            best = (count_a + count_b, plates_a + plates_b)
+
+    memo[key] = best
+    return best
+
+
 def _optimize_baseplate_layout(
     units_x: int,
     units_y: int,
@@ -95,6 +165,32 @@ def _optimize_baseplate_layout(
 ) -> list[tuple[int, int]]:
     """Optimize baseplate layout to minimize piece count and maximize size.
 
+    The layout depends only on the four unit counts, so the work is memoized
+    in :func:`_optimize_cached`; repeated calls over a family of drawer sizes
+    (batch invocations) hit the cache.
+
+    Args:
+        units_x: Total units in X dimension
+        units_y: Total units in Y dimension
+        max_units_x: Max units that fit on bed in X
+        max_units_y: Max units that fit on bed in Y
+        config: GridfinityConfig instance
+
+    Returns:
+        List of (x_units, y_units) tuples for each baseplate
+    """
+    return list(_optimize_cached(units_x, units_y, max_units_x, max_units_y))
+
+
+@functools.lru_cache(maxsize=1024)
+def _optimize_cached(
+    units_x: int,
+    units_y: int,
+    max_units_x: int,
+    max_units_y: int,
+) -> tuple[tuple[int, int], ...]:
+    """Computes the baseplate layout for the given unit counts, memoized.
+
     Strategy:
     1. If whole drawer fits on bed → single plate
     2. If one dimension fits → split along other dimension only
@@ -105,37 +201,32 @@ def _optimize_baseplate_layout(
         units_y: Total units in Y dimension
         max_units_x: Max units that fit on bed in X
         max_units_y: Max units that fit on bed in Y
-        config: GridfinityConfig instance
 
     Returns:
-        List of (x_units, y_units) tuples for each baseplate
+        Tuple of (x_units, y_units) pairs for each baseplate
     """
-    baseplates = []
-
     # Strategy 1: Single plate if drawer fits on bed
     if units_x <= max_units_x and units_y <= max_units_y:
         logger.info("Optimization: Drawer fits on single baseplate")
-        return [(units_x, units_y)]
+        return ((units_x, units_y),)
 
     # Strategy 2: Split along X dimension only (Y fits)
     if units_y <= max_units_y:
         logger.info("Optimization: Splitting along X dimension only")
-        remaining_x = units_x
-        while remaining_x > 0:
-            plate_x = min(remaining_x, max_units_x)
-            baseplates.append((plate_x, units_y))
-            remaining_x -= plate_x
-        return baseplates
+        full, rest = divmod(units_x, max_units_x)
+        baseplates = [(max_units_x, units_y)] * full
+        if rest:
+            baseplates.append((rest, units_y))
+        return tuple(baseplates)
 
     # Strategy 3: Split along Y dimension only (X fits)
     if units_x <= max_units_x:
         logger.info("Optimization: Splitting along Y dimension only")
-        remaining_y = units_y
-        while remaining_y > 0:
-            plate_y = min(remaining_y, max_units_y)
-            baseplates.append((units_x, plate_y))
-            remaining_y -= plate_y
-        return baseplates
+        full, rest = divmod(units_y, max_units_y)
+        baseplates = [(units_x, max_units_y)] * full
+        if rest:
+            baseplates.append((units_x, rest))
+        return tuple(baseplates)
 
     # Strategy 4: Both dimensions need splitting - use optimized grid
     logger.info("Optimization: Using 2D grid layout with minimal pieces")
@@ -143,28 +234,37 @@ def _optimize_baseplate_layout(
     # Calculate optimal split: prefer fewer, larger plates
     # Try to create plates as close to square as possible for stability
 
-    # Determine how many plates we need in each dimension
-    num_plates_x = math.ceil(units_x / max_units_x)
-    num_plates_y = math.ceil(units_y / max_units_y)
-
-    # Calculate base size and remainder for each dimension
-    base_size_x = units_x // num_plates_x
-    remainder_x = units_x % num_plates_x
-
-    base_size_y = units_y // num_plates_y
-    remainder_y = units_y % num_plates_y
-
-    # Generate plates row by row, distributing remainders evenly
-    for row in range(num_plates_y):
-        # Calculate Y size for this row (distribute remainder in first rows)
-        y_size = base_size_y + (1 if row < remainder_y else 0)
-
-        for col in range(num_plates_x):
-            # Calculate X size for this column (distribute remainder in first columns)
-            x_size = base_size_x + (1 if col < remainder_x else 0)
-            baseplates.append((x_size, y_size))
+    # Determine how many plates we need in each dimension; integer ceil-div
+    # avoids the float divide and any rounding surprises at exact multiples
+    num_plates_x = -(-units_x // max_units_x)
+    num_plates_y = -(-units_y // max_units_y)
+
+    # Calculate base size and remainder for each dimension, distributing the
+    # remainder over the first plates of each axis
+    base_size_x, remainder_x = divmod(units_x, num_plates_x)
+    base_size_y, remainder_y = divmod(units_y, num_plates_y)
+
+    x_sizes = np.full(num_plates_x, base_size_x, dtype=np.int64)
+    x_sizes[:remainder_x] += 1
+    y_sizes = np.full(num_plates_y, base_size_y, dtype=np.int64)
+    y_sizes[:remainder_y] += 1
+
+    # Row-major pairing (all columns of each row), matching the old loops
+    xx, yy = np.meshgrid(x_sizes, y_sizes)
+    grid = list(map(tuple, np.column_stack([xx.ravel(), yy.ravel()]).tolist()))
+
+    # The even grid is not always optimal; check whether a guillotine
+    # partition needs fewer plates and prefer it when it does
+    count, plates = _min_plates(units_x, units_y, max_units_x, max_units_y)
+    if count < len(grid):
+        logger.info(
+            "Optimization: Guillotine partition uses %s plates instead of %s",
+            count,
+            len(grid),
+        )
+        return tuple(plates)
 
-    return baseplates
+    return tuple(grid)
 
 
 def generate_spacer(
@@ -182,11 +282,38 @@ def generate_spacer(
     Returns:
         CadQuery Workplane containing the spacer geometry
     """
-    logger.info(f"Creating spacer: {width:.1f}mm x {depth:.1f}mm x {thickness}mm")
-    spacer = cq.Workplane("XY").box(width, depth, thickness)
-    # Add small fillet to edges for easier printing
-    spacer = spacer.edges("|Z").fillet(1.0)
-    return spacer
+    import cadquery as cq
+    from OCP.BRepAdaptor import BRepAdaptor_Curve
+    from OCP.BRepFilletAPI import BRepFilletAPI_MakeFillet
+    from OCP.BRepPrimAPI import BRepPrimAPI_MakeBox
+    from OCP.GeomAbs import GeomAbs_CurveType
+    from OCP.gp import gp_Pnt
+    from OCP.TopAbs import TopAbs_EDGE
+    from OCP.TopExp import TopExp
+    from OCP.TopoDS import TopoDS
+    from OCP.TopTools import TopTools_IndexedMapOfShape
+
+    logger.info("Creating spacer: %.1fmm x %.1fmm x %smm", width, depth, thickness)
+
+    # Build the box and fillet directly against OCCT; the Workplane DSL's
+    # selector parsing and dispatch cost more than this whole solid
+    corner = gp_Pnt(-width / 2, -depth / 2, -thickness / 2)
+    box = BRepPrimAPI_MakeBox(corner, width, depth, thickness).Shape()
+
+    # Add small fillet to the vertical edges for easier printing
+    fillet = BRepFilletAPI_MakeFillet(box)
+    edges = TopTools_IndexedMapOfShape()
+    TopExp.MapShapes_s(box, TopAbs_EDGE, edges)
+    for i in range(1, edges.Extent() + 1):
+        edge = TopoDS.Edge_s(edges.FindKey(i))
+        curve = BRepAdaptor_Curve(edge)
+        if (
+            curve.GetType() == GeomAbs_CurveType.GeomAbs_Line
+            and abs(curve.Line().Direction().Z()) > 0.999
+        ):
+            fillet.Add(1.0, edge)
+
+    return cq.Workplane(obj=cq.Shape.cast(fillet.Shape()))
 
 
 def calculate_spacer_dimensions(
@@ -198,6 +325,8 @@ def calculate_spacer_dimensions(
     """Calculate optimal spacer dimensions with reasonable aspect ratios.
 
     Splits long spacers into multiple pieces to avoid awkward dimensions.
+    Inputs are rounded to 3 decimals (well below print tolerance) so float
+    noise does not defeat the memoized helper.
 
     Args:
         gap: The gap width (smaller dimension) in mm
@@ -208,18 +337,30 @@ def calculate_spacer_dimensions(
     Returns:
         List of (width, depth) tuples for each spacer piece
     """
-    spacers = []
+    return list(
+        _spacer_dimensions_cached(
+            round(gap, 3), round(length, 3), max_length, max_aspect_ratio
+        )
+    )
+
 
-    # Calculate how many pieces we need based on constraints
-    # Constraint 1: Max length
-    num_pieces_length = math.ceil(length / max_length)
+@functools.lru_cache(maxsize=1024)
+def _spacer_dimensions_cached(
+    gap: float,
+    length: float,
+    max_length: float,
+    max_aspect_ratio: float,
+) -> tuple[tuple[float, float], ...]:
+    """Computes spacer piece dimensions for a gap, memoized."""
+    # Deferred like cadquery: numba (if installed) also has a slow import
+    # that layout-only callers should not pay for
+    from gridfinity._numeric import spacer_piece_count
 
-    # Constraint 2: Max aspect ratio
-    max_length_by_ratio = gap * max_aspect_ratio
-    num_pieces_ratio = math.ceil(length / max_length_by_ratio)
+    spacers = []
 
-    # Use the more restrictive constraint
-    num_pieces = max(num_pieces_length, num_pieces_ratio)
+    # The piece count is pure arithmetic over the length and aspect-ratio
+    # constraints, JIT-compiled when numba is available
+    num_pieces = spacer_piece_count(gap, length, max_length, max_aspect_ratio)
 
     if num_pieces == 1:
         # Single spacer is fine
@@ -232,11 +373,201 @@ def calculate_spacer_dimensions(
             spacers.append((gap, base_length))
 
         logger.info(
-            f"  Split {length:.1f}mm length into {num_pieces} pieces "
-            f"of {base_length:.1f}mm each (aspect ratio: {base_length/gap:.1f}:1)"
+            "  Split %.1fmm length into %s pieces of %.1fmm each "
+            "(aspect ratio: %.1f:1)",
+            length,
+            num_pieces,
+            base_length,
+            base_length / gap,
         )
 
-    return spacers
+    return tuple(spacers)
+
+
+def _pack_print_jobs(
+    baseplates: list[tuple[int, int]],
+    max_units_x: int,
+    max_units_y: int,
+    unit_size: float,
+) -> list[list[tuple[int, int, float, float]]]:
+    """Groups plates into print jobs that share a printer bed.
+
+    Uses first-fit decreasing shelf packing in grid units: plates are sorted
+    by area, then placed left-to-right on shelves stacked front-to-back,
+    opening a new bed only when a plate fits on no existing one.
+
+    Args:
+        baseplates: List of (x_units, y_units) plates to pack
+        max_units_x: Bed capacity in X, in grid units
+        max_units_y: Bed capacity in Y, in grid units
+        unit_size: Gridfinity unit size in mm
+
+    Returns:
+        List of jobs, each a list of (x_units, y_units, dx_mm, dy_mm) where
+        (dx_mm, dy_mm) locates the plate center relative to the bed corner
+    """
+    # Each job is (shelves, plates); each shelf is [x_cursor, y_start, height]
+    jobs: list[tuple[list[list[int]], list[tuple[int, int, float, float]]]] = []
+
+    for px, py in sorted(baseplates, key=lambda p: p[0] * p[1], reverse=True):
+        placed = False
+        for shelves, plates in jobs:
+            for shelf in shelves:
+                if shelf[0] + px <= max_units_x and py <= shelf[2]:
+                    sx, sy = shelf[0], shelf[1]
+                    shelf[0] += px
+                    placed = True
+                    break
+            else:
+                # No shelf fits; open a new one on this bed if there is room
+                y_used = sum(shelf[2] for shelf in shelves)
+                if py <= max_units_y - y_used:
+                    sx, sy = 0, y_used
+                    shelves.append([px, y_used, py])
+                    placed = True
+            if placed:
+                plates.append(
+                    (px, py, (sx + px / 2) * unit_size, (sy + py / 2) * unit_size)
+                )
+                break
+        if not placed:
+            jobs.append(
+                ([[px, 0, py]], [(px, py, px / 2 * unit_size, py / 2 * unit_size)])
+            )
+
+    return [plates for _, plates in jobs]
+
+
+def _init_worker(level: int = logging.INFO) -> None:
+    """Configures logging in export worker processes."""
+    logging.basicConfig(level=level)
+
+
+def _cadquery_version() -> str:
+    """Returns the installed cadquery version without importing it."""
+    from importlib import metadata
+
+    try:
+        return metadata.version("cadquery")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _stamp(description: str) -> str:
+    """Hashes a job description into a short regeneration stamp."""
+    return hashlib.blake2b(description.encode()).hexdigest()[:16]
+
+
+def _is_current(output_file: str, stamp: str) -> bool:
+    """Checks whether an STL exists with a matching stamp sidecar."""
+    stamp_file = Path(f"{output_file}.stamp")
+    return (
+        Path(output_file).exists()
+        and stamp_file.exists()
+        and stamp_file.read_text() == stamp
+    )
+
+
+def _atomic_export(write: Callable[[str], None], output_file: str) -> str:
+    """Writes an STL through a temp file renamed into place.
+
+    The meshing+serialization step lands in a sibling .partial file, then a
+    single rename publishes it, so readers never observe a half-written STL
+    and duplicate-detection copies always start from a complete file.
+    """
+    tmp_file = f"{output_file}.partial"
+    write(tmp_file)
+    os.replace(tmp_file, output_file)
+    return output_file
+
+
+def _export_plates(
+    plates: list[tuple[int, int, float, str]],
+    tolerance: float = STL_TOLERANCE,
+    angular_tolerance: float = STL_ANGULAR_TOLERANCE,
+) -> list[str]:
+    """Builds every per-plate STL through one shared tessellation pass.
+
+    The plates are gathered into a single compound so OCCT meshes all of
+    them in one parallel pass with one setup, then each pre-meshed solid is
+    written to its own binary STL (runs in a worker process).
+    """
+    import cadquery as cq
+    from OCP.BRepMesh import BRepMesh_IncrementalMesh
+
+    from gridfinity import baseplate
+    from gridfinity.export import _write_stl
+
+    shapes = [
+        baseplate(x_units, y_units, thickness).val()
+        for x_units, y_units, thickness, _ in plates
+    ]
+    compound = cq.Compound.makeCompound(shapes)
+    BRepMesh_IncrementalMesh(compound.wrapped, tolerance, False, angular_tolerance, True)
+
+    return [
+        _atomic_export(
+            lambda path, shape=shape: _write_stl(shape, path), output_file
+        )
+        for shape, (_, _, _, output_file) in zip(shapes, plates)
+    ]
+
+
+def _export_spacer(
+    width: float,
+    depth: float,
+    thickness: float,
+    output_file: str,
+    tolerance: float = STL_TOLERANCE,
+    angular_tolerance: float = STL_ANGULAR_TOLERANCE,
+) -> str:
+    """Builds one spacer and writes it to STL (runs in a worker process)."""
+    import cadquery as cq
+
+    spacer = generate_spacer(width, depth, thickness)
+    return _atomic_export(
+        lambda path: cq.exporters.export(
+            spacer,
+            path,
+            exportType="STL",
+            tolerance=tolerance,
+            angularTolerance=angular_tolerance,
+        ),
+        output_file,
+    )
+
+
+def _export_print_job(
+    plates: list[tuple[int, int, float, float]],
+    thickness: float,
+    output_file: str,
+    tolerance: float = STL_TOLERANCE,
+    angular_tolerance: float = STL_ANGULAR_TOLERANCE,
+) -> str:
+    """Builds one print job's plates and writes a multi-solid STL.
+
+    Grouping co-printed plates into a single assembly export amortizes the
+    per-call meshing setup and file overhead (runs in a worker process).
+    """
+    import cadquery as cq
+
+    from gridfinity import baseplate
+
+    asm = cq.Assembly()
+    for x_units, y_units, dx, dy in plates:
+        asm.add(
+            baseplate(x_units, y_units, thickness),
+            loc=cq.Location(cq.Vector(dx, dy, 0)),
+        )
+    return _atomic_export(
+        lambda path: asm.save(
+            path,
+            exportType="STL",
+            tolerance=tolerance,
+            angularTolerance=angular_tolerance,
+        ),
+        output_file,
+    )
 
 
 def generate_drawer_files(
@@ -244,14 +575,31 @@ def generate_drawer_files(
     drawer_depth: float,
     thickness: float = 5.0,
     output_dir: Path = OUTPUT_DIR,
+    stl_tolerance: float = STL_TOLERANCE,
+    stl_angular_tolerance: float = STL_ANGULAR_TOLERANCE,
+    per_plate_stls: bool = False,
+    force: bool = False,
+    bed_width: float = PRINTER_BED_WIDTH,
+    bed_depth: float = PRINTER_BED_DEPTH,
 ) -> None:
     """Generate all baseplates and spacers needed for a drawer.
 
+    Baseplates are grouped into print jobs that share a printer bed and each
+    job is exported as one multi-solid STL. Each job and spacer is fully
+    independent, so the CAD kernel work (meshing dominates) is dispatched to
+    a process pool and runs one job per core.
+
     Args:
         drawer_width: Width of drawer in mm
         drawer_depth: Depth of drawer in mm
         thickness: Thickness of baseplates/spacers in mm
         output_dir: Directory to save STL files
+        stl_tolerance: Linear tessellation tolerance in mm
+        stl_angular_tolerance: Angular tessellation tolerance in radians
+        per_plate_stls: Also write one STL per individual baseplate
+        force: Regenerate STLs even when an up-to-date file exists
+        bed_width: Printer bed width in mm
+        bed_depth: Printer bed depth in mm
     """
     # Create a subfolder named after the drawer dimensions
     drawer_folder = output_dir / f"drawer_{int(drawer_width)}_{int(drawer_depth)}"
@@ -262,44 +610,116 @@ def generate_drawer_files(
     logger.info("=" * 60)
 
     # Calculate layout
-    layout = calculate_baseplates(drawer_width, drawer_depth)
-
-    # Generate baseplate STL files
-    logger.info("\nGenerating baseplate files...")
-    for i, (x_units, y_units) in enumerate(layout["baseplates"], 1):
-        logger.info(f"Generating baseplate {i}/{len(layout['baseplates'])}...")
-        plate = baseplate(x_units, y_units, thickness)
-        output_file = drawer_folder / f"baseplate_{i}_{x_units}x{y_units}.stl"
-        cq.exporters.export(plate, str(output_file))
-        logger.info(f"  Saved: {output_file}")
-
-    # Generate spacer files if needed
-    gaps = layout["gaps"]
-    units = layout["drawer_units"]
+    layout = calculate_baseplates(
+        drawer_width, drawer_depth, bed_width=bed_width, bed_depth=bed_depth
+    )
     cfg = GridfinityConfig()
 
-    spacers_generated = []
+    # Group plates into print jobs that share a bed; each job becomes a
+    # single multi-solid STL export instead of one export call per plate
+    max_units_x = int(bed_width // cfg.unit_size)
+    max_units_y = int(bed_depth // cfg.unit_size)
+    print_jobs = _pack_print_jobs(
+        layout["baseplates"], max_units_x, max_units_y, cfg.unit_size
+    )
 
-    logger.info("\nGenerating spacer files...")
+    # Stamp sidecars record what each STL was generated from; matching
+    # stamps let reruns over the same drawer skip the OCCT meshing entirely
+    version = _cadquery_version()
+    stamps: dict[str, str] = {}
+    skipped = 0
+
+    def is_current(output_file: str, description: str) -> bool:
+        nonlocal skipped
+        stamp = _stamp(f"{description}|{version}")
+        stamps[output_file] = stamp
+        if not force and _is_current(output_file, stamp):
+            skipped += 1
+            logger.info("  Up to date: %s", output_file)
+            return True
+        return False
+
+    job_exports = []
+    for k, plates in enumerate(print_jobs, 1):
+        output_file = str(drawer_folder / f"print_job_{k}.stl")
+        description = f"job:{plates}:{thickness}:{stl_tolerance}:{stl_angular_tolerance}"
+        if is_current(output_file, description):
+            continue
+        job_exports.append(
+            (plates, thickness, output_file, stl_tolerance, stl_angular_tolerance)
+        )
+    logger.info(
+        "Grouped %s plates into %s print jobs",
+        len(layout["baseplates"]),
+        len(print_jobs),
+    )
+
+    # Optionally also collect per-plate export jobs. Identical dimensions
+    # produce identical STLs, so mesh each distinct (x, y, thickness) once
+    # and copy the file for the duplicates instead of re-running the kernel
+    seen_plates: dict[tuple[int, int, float], str] = {}
+    plate_jobs = []
+    file_copies = []
+    if per_plate_stls:
+        for i, (x_units, y_units) in enumerate(layout["baseplates"], 1):
+            output_file = str(drawer_folder / f"baseplate_{i}_{x_units}x{y_units}.stl")
+            key = (x_units, y_units, thickness)
+            description = (
+                f"plate:{x_units}x{y_units}:{thickness}"
+                f":{stl_tolerance}:{stl_angular_tolerance}"
+            )
+            if key in seen_plates:
+                if not is_current(output_file, description):
+                    file_copies.append((seen_plates[key], output_file))
+            elif is_current(output_file, description):
+                seen_plates[key] = output_file
+            else:
+                seen_plates[key] = output_file
+                plate_jobs.append((x_units, y_units, thickness, output_file))
+
+    # Collect spacer export jobs if needed
+    gaps = layout["gaps"]
+    units = layout["drawer_units"]
+
+    seen_spacers: dict[tuple[float, float, float], str] = {}
+    spacer_jobs = []
+    spacer_count = 0
+
+    def queue_spacer(width: float, depth: float, output_file: str) -> None:
+        nonlocal spacer_count
+        spacer_count += 1
+        key = (round(width, 2), round(depth, 2), thickness)
+        description = (
+            f"spacer:{key[0]}x{key[1]}:{thickness}"
+            f":{stl_tolerance}:{stl_angular_tolerance}"
+        )
+        if key in seen_spacers:
+            if not is_current(output_file, description):
+                file_copies.append((seen_spacers[key], output_file))
+        elif is_current(output_file, description):
+            seen_spacers[key] = output_file
+        else:
+            seen_spacers[key] = output_file
+            spacer_jobs.append(
+                (width, depth, thickness, output_file,
+                 stl_tolerance, stl_angular_tolerance)
+            )
 
     # X-direction spacers (gap in X, running along Y/depth of drawer)
     if gaps["x"] > 0.5:  # Only create if gap is significant
-        logger.info(f"X-direction gap: {gaps['x']:.1f}mm")
+        logger.info("X-direction gap: %.1fmm", gaps["x"])
         spacer_dims = calculate_spacer_dimensions(
             gaps["x"],
             units["y"] * cfg.unit_size
         )
 
         for i, (width, depth) in enumerate(spacer_dims, 1):
-            spacer = generate_spacer(width, depth, thickness)
             output_file = drawer_folder / f"spacer_x_{i}_{width:.1f}x{depth:.1f}mm.stl"
-            cq.exporters.export(spacer, str(output_file))
-            spacers_generated.append(output_file)
-            logger.info(f"  Saved: {output_file}")
+            queue_spacer(width, depth, str(output_file))
 
     # Y-direction spacers (gap in Y, running along X/width of drawer)
     if gaps["y"] > 0.5:  # Only create if gap is significant
-        logger.info(f"Y-direction gap: {gaps['y']:.1f}mm")
+        logger.info("Y-direction gap: %.1fmm", gaps["y"])
         spacer_dims = calculate_spacer_dimensions(
             gaps["y"],
             drawer_width
@@ -307,19 +727,47 @@ def generate_drawer_files(
 
         for i, (width, depth) in enumerate(spacer_dims, 1):
             # Note: width and depth are swapped here because we're orienting along X
-            spacer = generate_spacer(depth, width, thickness)
             output_file = drawer_folder / f"spacer_y_{i}_{depth:.1f}x{width:.1f}mm.stl"
-            cq.exporters.export(spacer, str(output_file))
-            spacers_generated.append(output_file)
-            logger.info(f"  Saved: {output_file}")
+            queue_spacer(depth, width, str(output_file))
+
+    # Run all exports in parallel; geometry is built inside the workers
+    logger.info("\nGenerating baseplate and spacer files...")
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(logging.getLogger().getEffectiveLevel(),),
+    ) as pool:
+        futures = [pool.submit(_export_print_job, *job) for job in job_exports]
+        futures += [pool.submit(_export_spacer, *job) for job in spacer_jobs]
+        if plate_jobs:
+            # All per-plate STLs share one tessellation setup in one worker
+            futures.append(
+                pool.submit(
+                    _export_plates, plate_jobs, stl_tolerance, stl_angular_tolerance
+                )
+            )
+        for future in as_completed(futures):
+            saved = future.result()
+            for path in saved if isinstance(saved, list) else [saved]:
+                Path(f"{path}.stamp").write_text(stamps[path])
+                logger.info("  Saved: %s", path)
+
+    # Fill in duplicate plates/spacers from the already-written files
+    for source, destination in file_copies:
+        shutil.copyfile(source, destination)
+        Path(f"{destination}.stamp").write_text(stamps[destination])
+        logger.info("  Copied: %s", destination)
 
     # Summary
     logger.info("\n" + "=" * 60)
     logger.info("GENERATION COMPLETE")
     logger.info("=" * 60)
-    logger.info(f"Baseplates generated: {len(layout['baseplates'])}")
-    logger.info(f"Spacers generated: {len(spacers_generated)}")
-    logger.info(f"Output directory: {drawer_folder}")
+    logger.info("Baseplates generated: %s", len(layout["baseplates"]))
+    logger.info("Print jobs generated: %s", len(print_jobs))
+    logger.info("Spacers generated: %s", spacer_count)
+    if skipped:
+        logger.info("Up-to-date files skipped: %s", skipped)
+    logger.info("Output directory: %s", drawer_folder)
 
 
 def main():
@@ -361,15 +809,54 @@ def main():
         default=PRINTER_BED_DEPTH,
         help=f"Printer bed depth in mm (default: {PRINTER_BED_DEPTH})",
     )
+    parser.add_argument(
+        "--per-plate-stls",
+        action="store_true",
+        help="Also write one STL per individual baseplate",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate STLs even when an up-to-date file exists",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only log warnings and errors",
+    )
+    parser.add_argument(
+        "--stl-linear-tol",
+        type=float,
+        default=STL_TOLERANCE,
+        help=f"STL linear tessellation tolerance in mm (default: {STL_TOLERANCE})",
+    )
+    parser.add_argument(
+        "--stl-angular-tol",
+        type=float,
+        default=STL_ANGULAR_TOLERANCE,
+        help=(
+            "STL angular tessellation tolerance in radians "
+            f"(default: {STL_ANGULAR_TOLERANCE})"
+        ),
+    )
 
     args = parser.parse_args()
 
-    # Update global bed size if provided
-    global PRINTER_BED_WIDTH, PRINTER_BED_DEPTH
-    PRINTER_BED_WIDTH = args.bed_width
-    PRINTER_BED_DEPTH = args.bed_depth
-
-    generate_drawer_files(args.width, args.depth, args.thickness, args.output)
+    if args.quiet:
+        logging.getLogger().setLevel(logging.WARNING)
+
+    generate_drawer_files(
+        args.width,
+        args.depth,
+        args.thickness,
+        args.output,
+        stl_tolerance=args.stl_linear_tol,
+        stl_angular_tolerance=args.stl_angular_tol,
+        per_plate_stls=args.per_plate_stls,
+        force=args.force,
+        bed_width=args.bed_width,
+        bed_depth=args.bed_depth,
+    )
 
 
 if __name__ == "__main__":